@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+One-off model quantization: FP32 yolov8n.onnx -> INT8 yolov8n_int8.onnx
+
+INT8 Conv/MatMul kernels use the ARM int8 dot-product instructions, which
+roughly halves inference time (and model size) compared to FP32 on the
+phone's CPU. Run this once, then YOLOv8Detector picks the INT8 model up
+automatically when it sits in models/.
+
+An FP16 export is also available for FP16-capable execution providers
+(GPU/CoreML); it halves model size and input bandwidth without needing
+any calibration.
+
+Usage:
+    python3 quantize_yolo.py            # static INT8 (calibrates on data/*.jpg)
+    python3 quantize_yolo.py --dynamic  # weights-only INT8, no calibration set
+    python3 quantize_yolo.py --fp16     # FP16 export
+    python3 quantize_yolo.py --uint8    # uint8-input export (normalization in-graph)
+"""
+
+import sys
+from pathlib import Path
+
+import cv2
+
+from yolo_detector import YOLOv8Detector
+
+BASE_DIR = Path(__file__).parent
+MODELS_DIR = BASE_DIR / "models"
+DATA_DIR = BASE_DIR / "data"
+FP32_MODEL = MODELS_DIR / "yolov8n.onnx"
+INT8_MODEL = MODELS_DIR / "yolov8n_int8.onnx"
+FP16_MODEL = MODELS_DIR / "yolov8n_fp16.onnx"
+UINT8_MODEL = MODELS_DIR / "yolov8n_uint8.onnx"
+
+
+def quantize_static_calibrated(images):
+    """Static quantization calibrated on real captured frames"""
+    from onnxruntime.quantization import (
+        CalibrationDataReader, QuantFormat, QuantType, quantize_static
+    )
+
+    # preprocess() needs no loaded session, so reuse it to build the same
+    # letterboxed 640x640 blobs the detector feeds at runtime
+    detector = YOLOv8Detector(FP32_MODEL)
+
+    class BlobReader(CalibrationDataReader):
+        def __init__(self):
+            self._paths = iter(images)
+
+        def get_next(self):
+            for path in self._paths:
+                image = cv2.imread(str(path))
+                if image is not None:
+                    blob, _ = detector.preprocess(image)
+                    return {'images': blob}
+            return None
+
+    quantize_static(
+        str(FP32_MODEL), str(INT8_MODEL), BlobReader(),
+        quant_format=QuantFormat.QDQ,
+        activation_type=QuantType.QUInt8,
+        weight_type=QuantType.QInt8,
+        per_channel=True,
+    )
+
+
+def quantize_weights_only():
+    """Dynamic quantization: no calibration data needed, slightly less gain"""
+    from onnxruntime.quantization import QuantType, quantize_dynamic
+
+    quantize_dynamic(str(FP32_MODEL), str(INT8_MODEL),
+                     weight_type=QuantType.QInt8)
+
+
+def convert_fp16():
+    """Halve weights and activations to float16; no calibration needed"""
+    import onnx
+    from onnxconverter_common import float16
+
+    model = onnx.load(str(FP32_MODEL))
+    onnx.save(float16.convert_float_to_float16(model, keep_io_types=False),
+              str(FP16_MODEL))
+
+
+def convert_uint8_input():
+    """Fold the /255 normalization and layout shuffles into the graph
+
+    The exported model then takes the raw uint8 BGR letterbox (NHWC)
+    directly: 1.2 MB across the input boundary instead of the 4.9 MB
+    float blob, with the Cast/Mul fused by ORT's optimizer.
+    """
+    import numpy as np
+    import onnx
+    from onnx import TensorProto, helper, numpy_helper
+
+    model = onnx.load(str(FP32_MODEL))
+    graph = model.graph
+    float_input = graph.input[0].name
+
+    new_input = helper.make_tensor_value_info(
+        'images_u8', TensorProto.UINT8, [1, 640, 640, 3])
+    graph.input.remove(graph.input[0])
+    graph.input.insert(0, new_input)
+
+    graph.initializer.extend([
+        numpy_helper.from_array(np.float32(1.0 / 255.0), 'u8_scale'),
+        numpy_helper.from_array(np.array([2, 1, 0], np.int64), 'u8_bgr_to_rgb'),
+    ])
+    prep_nodes = [
+        helper.make_node('Gather', ['images_u8', 'u8_bgr_to_rgb'],
+                         ['u8_rgb'], axis=3),
+        helper.make_node('Cast', ['u8_rgb'], ['u8_float'],
+                         to=TensorProto.FLOAT),
+        helper.make_node('Mul', ['u8_float', 'u8_scale'], ['u8_scaled']),
+        helper.make_node('Transpose', ['u8_scaled'], [float_input],
+                         perm=[0, 3, 1, 2]),
+    ]
+    for i, node in enumerate(prep_nodes):
+        graph.node.insert(i, node)
+
+    onnx.save(model, str(UINT8_MODEL))
+
+
+def main():
+    if not FP32_MODEL.exists():
+        print(f"Model not found: {FP32_MODEL}")
+        sys.exit(1)
+
+    if '--uint8' in sys.argv:
+        print("Folding uint8 input + normalization into the graph...")
+        convert_uint8_input()
+        size_mb = UINT8_MODEL.stat().st_size / 1e6
+        print(f"Saved: {UINT8_MODEL.name} ({size_mb:.1f} MB)")
+        print("Load it with YOLOv8Detector('models/yolov8n_uint8.onnx');")
+        print("the detector then feeds the raw letterbox bytes.")
+        return
+
+    if '--fp16' in sys.argv:
+        print("Converting to FP16...")
+        convert_fp16()
+        size_mb = FP16_MODEL.stat().st_size / 1e6
+        print(f"Saved: {FP16_MODEL.name} ({size_mb:.1f} MB)")
+        print("Load it with YOLOv8Detector('models/yolov8n_fp16.onnx');")
+        print("the detector feeds float16 input automatically.")
+        return
+
+    images = sorted(DATA_DIR.glob("event_*.jpg"))[:100]
+
+    if '--dynamic' in sys.argv:
+        print("Quantizing (dynamic, weights only)...")
+        quantize_weights_only()
+    elif not images:
+        print("No captured frames in data/ for calibration")
+        print("Falling back to dynamic quantization...")
+        quantize_weights_only()
+    else:
+        print(f"Quantizing (static, {len(images)} calibration frames)...")
+        quantize_static_calibrated(images)
+
+    size_mb = INT8_MODEL.stat().st_size / 1e6
+    print(f"Saved: {INT8_MODEL.name} ({size_mb:.1f} MB)")
+    print("The detector will use it automatically on next load.")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,26 +4,81 @@ Neighborhood Watch - Simple Interface
 Your personal street observer control panel
 """
 
+import atexit
 import os
 import sys
+import json
+import select
 import subprocess
 import signal
+import time
+from collections import deque
 from pathlib import Path
 from datetime import datetime
 
 BASE_DIR = Path(__file__).parent
 OBSERVER_SCRIPT = BASE_DIR / "smart_observer.py"
 LOG_FILE = BASE_DIR / "street_log.txt"
+ROTATED_LOG = BASE_DIR / "street_log.1.txt"
+LOG_MAX_BYTES = 5 * 1024 * 1024
 DATA_DIR = BASE_DIR / "data"
 PID_FILE = BASE_DIR / ".observer.pid"
+CURSOR_FILE = BASE_DIR / ".watch_cursor.json"
 
+sys.path.insert(0, str(BASE_DIR))
 
-def clear_screen():
-    os.system('clear')
+# Lazy loader so launching the menu doesn't pay for report.py (or any
+# future optional dependency) until the feature is actually used
+_gen_report = None
 
 
-def print_header():
-    print("""
+def _get_gen_report():
+    global _gen_report
+    if _gen_report is None:
+        try:
+            from report import generate_report
+            _gen_report = generate_report
+        except ImportError:
+            _gen_report = False
+    return _gen_report or None
+
+
+def _run(cmd, timeout=5):
+    """Run an external command, swallowing the usual Termux failure modes
+
+    Returns (returncode, stdout_bytes); (-1, b'') on timeout or when the
+    command is not installed.
+    """
+    try:
+        result = subprocess.run(cmd, capture_output=True, timeout=timeout)
+        return result.returncode, result.stdout
+    except (subprocess.TimeoutExpired, FileNotFoundError, OSError):
+        return -1, b''
+
+
+def _ttl_cache(ttl):
+    """Cache a zero/few-arg probe for ttl seconds (menu redraws are frequent)"""
+    def decorator(func):
+        cache = {}
+
+        def wrapper(*args):
+            now = time.monotonic()
+            hit = cache.get(args)
+            if hit is not None and now < hit[1]:
+                return hit[0]
+            value = func(*args)
+            cache[args] = (value, now + ttl)
+            return value
+
+        wrapper.invalidate = cache.clear
+        return wrapper
+    return decorator
+
+
+# ANSI home + clear: avoids forking /bin/clear on every redraw
+_CLEAR = "\x1b[H\x1b[2J"
+
+_HEADER = """
 ╔══════════════════════════════════════════════════════════════╗
 ║                                                              ║
 ║              🏠  NEIGHBORHOOD WATCH  🏠                      ║
@@ -31,60 +86,305 @@ def print_header():
 ║         Your Personal Street Intelligence System             ║
 ║                                                              ║
 ╚══════════════════════════════════════════════════════════════╝
-""")
+"""
+
+
+def clear_screen():
+    if sys.stdout.isatty():
+        sys.stdout.write(_CLEAR)
+        sys.stdout.flush()
+    else:
+        os.system('clear')
+
+
+def print_header():
+    print(_HEADER)
 
 
+@_ttl_cache(ttl=10)
 def get_battery():
-    try:
-        result = subprocess.run(['termux-battery-status'],
-                              capture_output=True, text=True, timeout=5)
-        if result.returncode == 0:
-            import json
-            data = json.loads(result.stdout)
+    code, out = _run(['termux-battery-status'])
+    if code == 0:
+        try:
+            data = json.loads(out)
             return data.get('percentage', '?'), data.get('status', '?')
-    except:
-        pass
+        except ValueError:
+            pass
     return '?', '?'
 
 
+def _read_observer_pid():
+    """Read the observer PID from the PID file, or None"""
+    try:
+        return int(PID_FILE.read_text().strip())
+    except (OSError, ValueError):
+        return None
+
+
+def _pid_is_observer(pid):
+    """Check that pid is alive and actually runs smart_observer.py"""
+    try:
+        os.kill(pid, 0)  # Raises if the process is gone
+        with open(f'/proc/{pid}/cmdline', 'rb') as f:
+            return b'smart_observer.py' in f.read()
+    except (OSError, ProcessLookupError):
+        return False
+
+
+@_ttl_cache(ttl=2)
 def is_observer_running():
     """Check if observer is running"""
-    try:
-        result = subprocess.run(['pgrep', '-f', 'smart_observer.py'],
-                              capture_output=True, text=True)
-        return result.returncode == 0
-    except:
+    pid = _read_observer_pid()
+    if pid is not None:
+        if _pid_is_observer(pid):
+            return True
+        PID_FILE.unlink(missing_ok=True)  # Stale PID file
         return False
+    # No PID file (observer started outside this menu) - fall back to pgrep
+    code, _ = _run(['pgrep', '-f', 'smart_observer.py'])
+    return code == 0
+
+
+_log_fh = None
+
+
+def _log():
+    """Cached binary handle to the log, reopened only on rotation"""
+    global _log_fh
+    if _log_fh is not None:
+        try:
+            if os.fstat(_log_fh.fileno()).st_ino == os.stat(LOG_FILE).st_ino:
+                return _log_fh
+        except OSError:
+            pass
+        _log_fh.close()
+        _log_fh = None
+    _log_fh = open(LOG_FILE, 'rb')
+    return _log_fh
+
+
+atexit.register(lambda: _log_fh and _log_fh.close())
+
+
+def _iter_log_tail_bytes(chunk=65536):
+    """Yield log lines as bytes, newest first, reading backwards in chunks"""
+    yield from _iter_tail_from(_log(), chunk)
+
+
+def _iter_tail_from(f, chunk=65536):
+    """Reverse-chunk line iterator over an already open binary file"""
+    f.seek(0, os.SEEK_END)
+    pos = f.tell()
+
+    # Small file: one forward read is cheaper than seeking around
+    if pos < 2 * chunk:
+        f.seek(0)
+        yield from reversed(f.read().splitlines())
+        return
+
+    carry = b''
+    while pos > 0:
+        n = min(chunk, pos)
+        pos -= n
+        f.seek(pos)
+        lines = (f.read(n) + carry).split(b'\n')
+        carry = lines[0]  # May be a partial line; complete it next chunk
+        yield from reversed(lines[1:])
+    if carry:
+        yield carry
+
+
+_DETECTED = b'DETECTED'
+_today_cache = (None, '', b'')  # (date, str, bytes)
+
+
+def _today():
+    """Return (str, bytes) for today's date, recomputed only on day change"""
+    global _today_cache
+    day = datetime.now().date()
+    if day != _today_cache[0]:
+        s = day.strftime('%Y-%m-%d')
+        _today_cache = (day, s, s.encode())
+    return _today_cache[1], _today_cache[2]
+
+
+# Incremental log-tail state: after the first (seed) scan, each refresh
+# only reads bytes appended since the previous one.
+_log_pos = 0
+_events_today = 0
+_events_today_date = None
+_last_event = None
+_cursor_saved_pos = 0
+
+
+def _load_cursor():
+    """Resume the log-tail cursor from a previous run, if still valid"""
+    global _log_pos, _events_today, _events_today_date, _last_event
+    global _cursor_saved_pos
+    try:
+        cursor = json.loads(CURSOR_FILE.read_text())
+        st = os.stat(LOG_FILE)
+        # Inode mismatch or a shrunken file means the log was rotated
+        if st.st_ino == cursor['inode'] and st.st_size >= cursor['offset']:
+            _log_pos = cursor['offset']
+            _events_today = cursor['events_today']
+            _events_today_date = cursor['date']
+            _last_event = cursor.get('last_event')
+            _cursor_saved_pos = _log_pos
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+
+def _save_cursor():
+    """Atomically checkpoint the log-tail cursor for the next run"""
+    global _cursor_saved_pos
+    try:
+        st = os.stat(LOG_FILE)
+        tmp = BASE_DIR / '.watch_cursor.json.tmp'
+        tmp.write_text(json.dumps({
+            'inode': st.st_ino,
+            'size': st.st_size,
+            'offset': _log_pos,
+            'date': _events_today_date,
+            'events_today': _events_today,
+            'last_event': _last_event,
+        }))
+        os.replace(tmp, CURSOR_FILE)
+        _cursor_saved_pos = _log_pos
+    except OSError:
+        pass
+
+
+def _seed_log_state(today_b):
+    """Cold start or day rollover: one reverse pass to rebuild counter state"""
+    global _events_today, _last_event
+    _events_today = 0
+    _last_event = None
+    past_today = False
+    detected = _DETECTED
+    for line in _iter_log_tail_bytes():
+        if not past_today and line[:1] == b'[' and line[1:11] < today_b:
+            past_today = True  # Older lines can't count for today
+        if detected in line:
+            if _last_event is None:
+                _last_event = line.decode(errors='replace').strip()
+            if not past_today and today_b in line:
+                _events_today += 1
+        if past_today and _last_event is not None:
+            break
+
+
+def _maybe_rotate_log():
+    """Cap the live log so tail scans stay fast indefinitely
+
+    Renames street_log.txt to street_log.1.txt once it exceeds
+    LOG_MAX_BYTES and starts a fresh file. In-process counters survive:
+    only the read offset is reset for the new, empty file. Rotation is
+    deferred until every appended byte has been folded into the counters
+    (_log_pos caught up), so a backlog accumulated while the menu was
+    closed is never renamed away uncounted.
+    """
+    global _log_fh, _log_pos
+    if _events_today_date != _today()[0]:
+        return  # Counters not seeded yet; seed first, rotate on the next pass
+    try:
+        st = os.stat(LOG_FILE)
+        if st.st_size <= LOG_MAX_BYTES or st.st_size != _log_pos:
+            return
+        os.replace(LOG_FILE, ROTATED_LOG)
+        LOG_FILE.touch()
+    except OSError:
+        return
+    if _log_fh is not None:
+        _log_fh.close()
+        _log_fh = None
+    _log_pos = 0
+    _save_cursor()
+
 
+def _refresh_log_tail():
+    """Fold any newly appended log bytes into the in-process counters"""
+    global _log_pos, _events_today, _events_today_date, _last_event
 
+    _maybe_rotate_log()
+    today, today_b = _today()
+    try:
+        st = os.stat(LOG_FILE)
+    except OSError:
+        _log_pos, _events_today, _last_event = 0, 0, None
+        _events_today_date = today
+        return
+
+    if st.st_size < _log_pos:
+        # Log was rotated or truncated behind our back; force a re-seed
+        _log_pos = 0
+        _events_today_date = None
+
+    if today != _events_today_date:
+        _events_today_date = today
+        _seed_log_state(today_b)
+        _log_pos = st.st_size
+        _save_cursor()
+        return
+
+    if st.st_size == _log_pos:
+        return  # Nothing new: refresh cost one stat call
+
+    f = _log()
+    f.seek(_log_pos)
+    data = f.read(st.st_size - _log_pos)
+
+    end = data.rfind(b'\n')
+    if end < 0:
+        return  # Partial line still being written; pick it up next time
+
+    detected = _DETECTED
+    for line in data[:end].split(b'\n'):
+        if detected in line:
+            _last_event = line.decode(errors='replace').strip()
+            if today_b in line[:32]:
+                _events_today += 1
+    _log_pos += end + 1
+
+    # Checkpoint occasionally; atexit covers the final position
+    if _log_pos - _cursor_saved_pos > 65536:
+        _save_cursor()
+
+
+def _log_summary():
+    """Return (events_today, last_event), maintained incrementally
+
+    The first call scans the log tail once; afterwards only bytes the
+    observer appended since the last call are read.
+    """
+    _refresh_log_tail()
+    return _events_today, _last_event
+
+
+_load_cursor()
+atexit.register(_save_cursor)
+
+
+@_ttl_cache(ttl=5)
 def count_events_today():
     """Count today's events"""
-    today = datetime.now().strftime('%Y-%m-%d')
-    count = 0
-    if LOG_FILE.exists():
-        with open(LOG_FILE) as f:
-            for line in f:
-                if today in line and 'DETECTED' in line:
-                    count += 1
-    return count
+    return _log_summary()[0]
 
 
+@_ttl_cache(ttl=5)
 def count_images():
     """Count saved event images"""
-    return len(list(DATA_DIR.glob('event_*.jpg')))
+    try:
+        with os.scandir(DATA_DIR) as it:
+            return sum(1 for e in it
+                       if e.name.startswith('event_') and e.name.endswith('.jpg'))
+    except OSError:
+        return 0
 
 
 def get_last_event():
     """Get last detection"""
-    if not LOG_FILE.exists():
-        return None
-
-    last = None
-    with open(LOG_FILE) as f:
-        for line in f:
-            if 'DETECTED' in line:
-                last = line.strip()
-    return last
+    return _log_summary()[1]
 
 
 def show_status():
@@ -94,27 +394,27 @@ def show_status():
 
     running = is_observer_running()
     battery, charging = get_battery()
-    events_today = count_events_today()
+    events_today, last_event = _log_summary()
     total_images = count_images()
-    last_event = get_last_event()
 
     status = "🟢 RUNNING" if running else "🔴 STOPPED"
 
-    print(f"  System Status: {status}")
-    print(f"  Battery: {battery}% ({charging})")
-    print()
-    print(f"  📊 Today's Events: {events_today}")
-    print(f"  📷 Total Images: {total_images}")
-    print()
-
+    lines = [
+        f"  System Status: {status}",
+        f"  Battery: {battery}% ({charging})",
+        "",
+        f"  📊 Today's Events: {events_today}",
+        f"  📷 Total Images: {total_images}",
+        "",
+    ]
     if last_event:
-        print(f"  🕐 Last Event:")
-        print(f"     {last_event}")
+        lines += ["  🕐 Last Event:", f"     {last_event}"]
     else:
-        print("  🕐 No events recorded yet")
+        lines.append("  🕐 No events recorded yet")
+    lines += ["", "─" * 60, ""]
 
-    print()
-    print("─" * 60)
+    sys.stdout.write("\n".join(lines))
+    sys.stdout.flush()
     input("\nPress Enter to continue...")
 
 
@@ -126,12 +426,14 @@ def start_observer():
         return
 
     print("\n🚀 Starting observer...")
-    subprocess.Popen(
+    proc = subprocess.Popen(
         ['python3', str(OBSERVER_SCRIPT)],
         stdout=open(BASE_DIR / '.observer.log', 'w'),
         stderr=subprocess.STDOUT,
         start_new_session=True
     )
+    PID_FILE.write_text(str(proc.pid))
+    is_observer_running.invalidate()
     print("✅ Observer started!")
     print("   Position your phone facing the street.")
     input("\nPress Enter to continue...")
@@ -145,7 +447,25 @@ def stop_observer():
         return
 
     print("\n🛑 Stopping observer...")
-    subprocess.run(['pkill', '-f', 'smart_observer.py'])
+    pid = _read_observer_pid()
+    if pid is not None:
+        try:
+            os.kill(pid, signal.SIGTERM)
+            for _ in range(50):
+                try:
+                    os.kill(pid, 0)
+                    time.sleep(0.1)
+                except ProcessLookupError:
+                    break
+            else:
+                os.kill(pid, signal.SIGKILL)  # Didn't exit within 5s
+        except (ProcessLookupError, PermissionError):
+            pass
+        PID_FILE.unlink(missing_ok=True)
+    else:
+        # No PID file - fall back to a process-table sweep
+        _run(['pkill', '-f', 'smart_observer.py'])
+    is_observer_running.invalidate()
     print("✅ Observer stopped!")
     input("\nPress Enter to continue...")
 
@@ -155,10 +475,11 @@ def show_report():
     clear_screen()
     print_header()
 
-    # Import and run report
-    sys.path.insert(0, str(BASE_DIR))
-    from report import generate_report
-    print(generate_report())
+    generate_report = _get_gen_report()
+    if generate_report is not None:
+        print(generate_report())
+    else:
+        print("  ⚠️  report.py could not be loaded.")
 
     print()
     input("Press Enter to continue...")
@@ -174,15 +495,27 @@ def show_recent_events():
     if not LOG_FILE.exists():
         print("  No events recorded yet.")
     else:
-        # Get last 20 lines with DETECTED
-        events = []
-        with open(LOG_FILE) as f:
-            for line in f:
-                if 'DETECTED' in line:
-                    events.append(line.strip())
+        # Collect the last 20 DETECTED lines, bounded memory regardless of log size
+        events = deque(maxlen=20)
+        detected = _DETECTED
+        for line in _iter_log_tail_bytes():
+            if detected in line:
+                events.appendleft(line.decode(errors='replace').strip())
+                if len(events) == 20:
+                    break
+
+        # Right after a rotation the live log may be short; top up from
+        # the rotated file
+        if len(events) < 20 and ROTATED_LOG.exists():
+            with open(ROTATED_LOG, 'rb') as f:
+                for line in _iter_tail_from(f):
+                    if detected in line:
+                        events.appendleft(line.decode(errors='replace').strip())
+                        if len(events) == 20:
+                            break
 
         if events:
-            for event in events[-20:]:
+            for event in events:
                 print(f"  {event}")
         else:
             print("  No detections yet.")
@@ -193,21 +526,30 @@ def show_recent_events():
 
 def view_last_image():
     """View the last captured event image"""
-    images = sorted(DATA_DIR.glob('event_*.jpg'))
+    # Timestamped names sort chronologically, so a single max pass suffices
+    last = None
+    try:
+        with os.scandir(DATA_DIR) as it:
+            for entry in it:
+                name = entry.name
+                if name.startswith('event_') and name.endswith('.jpg'):
+                    if last is None or name > last.name:
+                        last = entry
+    except FileNotFoundError:
+        pass
 
-    if not images:
+    if last is None:
         print("\n⚠️  No event images saved yet!")
         input("Press Enter to continue...")
         return
 
-    last_image = images[-1]
+    last_image = Path(last.path)
     print(f"\n📷 Last image: {last_image.name}")
-    print(f"   Size: {last_image.stat().st_size / 1024:.1f} KB")
+    print(f"   Size: {last.stat().st_size / 1024:.1f} KB")
     print(f"\n   Opening with termux-open...")
 
-    try:
-        subprocess.run(['termux-open', str(last_image)], timeout=5)
-    except:
+    code, _ = _run(['termux-open', str(last_image)])
+    if code != 0:
         print(f"   Path: {last_image}")
 
     input("\nPress Enter to continue...")
@@ -219,24 +561,18 @@ def take_snapshot():
 
     temp_path = DATA_DIR / f"snapshot_{datetime.now().strftime('%Y%m%d_%H%M%S')}.jpg"
 
-    try:
-        result = subprocess.run(
-            ['termux-camera-photo', '-c', '0', str(temp_path)],
-            capture_output=True, timeout=15
-        )
-
-        if result.returncode == 0 and temp_path.exists():
-            print(f"✅ Saved: {temp_path.name}")
-            print(f"   Size: {temp_path.stat().st_size / 1024:.1f} KB")
-
-            # Offer to open
-            response = input("\nOpen image? [y/N]: ").strip().lower()
-            if response == 'y':
-                subprocess.run(['termux-open', str(temp_path)], timeout=5)
-        else:
-            print("❌ Capture failed!")
-    except Exception as e:
-        print(f"❌ Error: {e}")
+    code, _ = _run(['termux-camera-photo', '-c', '0', str(temp_path)], timeout=15)
+
+    if code == 0 and temp_path.exists():
+        print(f"✅ Saved: {temp_path.name}")
+        print(f"   Size: {temp_path.stat().st_size / 1024:.1f} KB")
+
+        # Offer to open
+        response = input("\nOpen image? [y/N]: ").strip().lower()
+        if response == 'y':
+            _run(['termux-open', str(temp_path)])
+    else:
+        print("❌ Capture failed!")
 
     input("\nPress Enter to continue...")
 
@@ -248,25 +584,45 @@ def cleanup_old_files():
     print("  CLEANUP")
     print("─" * 60)
 
-    # Count different file types
-    frames = list(DATA_DIR.glob('frame_*.jpg'))
-    events = list(DATA_DIR.glob('event_*.jpg'))
-    snapshots = list(DATA_DIR.glob('snapshot_*.jpg'))
+    # One directory pass, accumulating [count, bytes] per category so no
+    # per-file list survives the preview
+    totals = {'frame_': [0, 0], 'event_': [0, 0], 'snapshot_': [0, 0]}
+    try:
+        with os.scandir(DATA_DIR) as it:
+            for entry in it:
+                name = entry.name
+                if not name.endswith('.jpg'):
+                    continue
+                for prefix, bucket in totals.items():
+                    if name.startswith(prefix):
+                        bucket[0] += 1
+                        bucket[1] += entry.stat().st_size
+                        break
+    except FileNotFoundError:
+        pass
 
-    frames_size = sum(f.stat().st_size for f in frames) / (1024*1024)
-    events_size = sum(f.stat().st_size for f in events) / (1024*1024)
+    frame_count, frame_bytes = totals['frame_']
+    event_count, event_bytes = totals['event_']
+    snapshot_count = totals['snapshot_'][0]
 
-    print(f"  📁 Frame files (old observer): {len(frames)} ({frames_size:.1f} MB)")
-    print(f"  📁 Event files (detections):   {len(events)} ({events_size:.1f} MB)")
-    print(f"  📁 Snapshots:                  {len(snapshots)}")
+    print(f"  📁 Frame files (old observer): {frame_count} ({frame_bytes / (1024*1024):.1f} MB)")
+    print(f"  📁 Event files (detections):   {event_count} ({event_bytes / (1024*1024):.1f} MB)")
+    print(f"  📁 Snapshots:                  {snapshot_count}")
     print()
 
-    if frames:
+    if frame_count:
         response = input("  Delete old frame files? [y/N]: ").strip().lower()
         if response == 'y':
-            for f in frames:
-                f.unlink()
-            print(f"  ✅ Deleted {len(frames)} frame files")
+            deleted = 0
+            try:
+                with os.scandir(DATA_DIR) as it:
+                    for entry in it:
+                        if entry.name.startswith('frame_') and entry.name.endswith('.jpg'):
+                            os.unlink(entry.path)
+                            deleted += 1
+            except FileNotFoundError:
+                pass
+            print(f"  ✅ Deleted {deleted} frame files")
 
     input("\nPress Enter to continue...")
 
@@ -275,59 +631,114 @@ def show_settings():
     """Show current settings"""
     clear_screen()
     print_header()
-    print("  SETTINGS")
-    print("─" * 60)
-    print()
-    print("  Current configuration:")
-    print("  • Capture interval: 10 seconds")
-    print("  • Motion threshold: 3%")
-    print("  • Detection confidence: 30%")
-    print("  • Camera: Back (0)")
-    print()
-    print("  Paths:")
-    print(f"  • Base: {BASE_DIR}")
-    print(f"  • Data: {DATA_DIR}")
-    print(f"  • Log:  {LOG_FILE}")
-    print()
-    print("  (Edit smart_observer.py to change settings)")
-    print()
+    sys.stdout.write("\n".join([
+        "  SETTINGS",
+        "─" * 60,
+        "",
+        "  Current configuration:",
+        "  • Capture interval: 10 seconds",
+        "  • Motion threshold: 3%",
+        "  • Detection confidence: 30%",
+        "  • Camera: Back (0)",
+        "",
+        "  Paths:",
+        f"  • Base: {BASE_DIR}",
+        f"  • Data: {DATA_DIR}",
+        f"  • Log:  {LOG_FILE}",
+        "",
+        "  (Edit smart_observer.py to change settings)",
+        "",
+    ]))
+    sys.stdout.flush()
     input("Press Enter to continue...")
 
 
+# Idle auto-refresh with exponential backoff: redraw quickly after a state
+# change, then progressively less often while nothing changes.
+_REFRESH_MIN = 2.0
+_REFRESH_MAX = 15.0
+_REFRESH_FACTOR = 1.5
+_refresh_interval = _REFRESH_MIN
+
+
+# Static menu body, written in the same single stdout call as the header
+_MENU_BODY = "\n".join([
+    "",
+    "─" * 60,
+    "",
+    "  CONTROL",
+    "    1. Start observer",
+    "    2. Stop observer",
+    "    3. Take snapshot now",
+    "",
+    "  VIEW",
+    "    4. System status",
+    "    5. Daily report",
+    "    6. Recent events",
+    "    7. View last image",
+    "",
+    "  MANAGE",
+    "    8. Cleanup files",
+    "    9. Settings",
+    "",
+    "    0. Exit",
+    "",
+    "─" * 60,
+    "",
+])
+
+
+def _render_menu():
+    """Draw the main menu in one stdout write; probes go through their caches
+
+    Returns the (running, events_today) state the screen was drawn from.
+    """
+    clear_screen()
+
+    running = is_observer_running()
+    status = "🟢 Running" if running else "🔴 Stopped"
+    events_today = count_events_today()
+
+    sys.stdout.write(
+        f"{_HEADER}\n"
+        f"  Status: {status}    |    Today: {events_today} events\n"
+        f"{_MENU_BODY}"
+    )
+    sys.stdout.flush()
+
+    return running, events_today
+
+
 def main_menu():
     """Main menu loop"""
+    global _refresh_interval
+    last_state = None
+
     while True:
-        clear_screen()
-        print_header()
-
-        running = is_observer_running()
-        status = "🟢 Running" if running else "🔴 Stopped"
-        events_today = count_events_today()
-
-        print(f"  Status: {status}    |    Today: {events_today} events")
-        print()
-        print("─" * 60)
-        print()
-        print("  CONTROL")
-        print("    1. Start observer")
-        print("    2. Stop observer")
-        print("    3. Take snapshot now")
-        print()
-        print("  VIEW")
-        print("    4. System status")
-        print("    5. Daily report")
-        print("    6. Recent events")
-        print("    7. View last image")
-        print()
-        print("  MANAGE")
-        print("    8. Cleanup files")
-        print("    9. Settings")
-        print()
-        print("    0. Exit")
-        print()
-        print("─" * 60)
-
-        choice = input("\n  Enter choice: ").strip()
+        state = _render_menu()
+
+        sys.stdout.write("\n  Enter choice: ")
+        sys.stdout.flush()
+        ready, _, _ = select.select([sys.stdin], [], [], _refresh_interval)
+
+        if not ready:
+            # Idle timeout: redraw, backing off while the display is unchanged
+            if state == last_state:
+                _refresh_interval = min(_REFRESH_MAX,
+                                        _refresh_interval * _REFRESH_FACTOR)
+            else:
+                _refresh_interval = _REFRESH_MIN
+            last_state = state
+            continue
+
+        line = sys.stdin.readline()
+        if not line:
+            break  # stdin closed
+
+        # User action: poll quickly again
+        _refresh_interval = _REFRESH_MIN
+        last_state = state
+        choice = line.strip()
 
         if choice == '1':
             start_observer()
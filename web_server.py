@@ -5,21 +5,203 @@ Access your street observer from anywhere
 """
 
 from http.server import HTTPServer, BaseHTTPRequestHandler
+from socketserver import ThreadingMixIn
+import gzip
+import hashlib
+import heapq
+import hmac
 import json
+import mmap
 import os
+import shutil
 import subprocess
+import threading
+import time
 import urllib.parse
 from pathlib import Path
 from datetime import datetime
 import re
 from collections import defaultdict
 
+# orjson serializes straight to bytes and is several times faster than the
+# stdlib encoder on the /api/state payload; fall back quietly when absent
+try:
+    import orjson
+    _json_dumps = orjson.dumps
+except ImportError:
+    def _json_dumps(data):
+        return json.dumps(data).encode()
+
 BASE_DIR = Path(__file__).parent
 DATA_DIR = BASE_DIR / "data"
 LOG_FILE = BASE_DIR / "street_log.txt"
+ROTATED_LOG = BASE_DIR / "street_log.1.txt"
 
 # Simple auth (change this!)
 AUTH_TOKEN = "neighborhood2024"
+_AUTH_TOKEN_BYTES = AUTH_TOKEN.encode()
+
+class ThreadedHTTPServer(ThreadingMixIn, HTTPServer):
+    """One daemon thread per request so slow handlers don't block the rest"""
+    daemon_threads = True
+    request_queue_size = 64
+
+
+# The camera device can't service two termux-camera-photo calls at once
+_snapshot_sem = threading.Semaphore(1)
+
+# Latest live snapshot per camera; the server is the only writer, so after
+# the first fill this makes /api/live O(1) with no directory scan
+_latest_live = {'back': None, 'front': None}
+
+
+# Probe caches, refreshed by the background poller thread started in main().
+# The TTLs are a fallback bound: they only kick in if the poller is not
+# running (e.g. handler code imported without main), so request handlers
+# normally never fork or rescan /proc themselves.
+_battery_cache = {'t': 0.0, 'v': 0}
+_running_cache = {'t': 0.0, 'v': False}
+
+
+def _fetch_battery():
+    try:
+        result = subprocess.run(['termux-battery-status'],
+                              capture_output=True, text=True, timeout=5)
+        if result.returncode == 0:
+            return json.loads(result.stdout).get('percentage', 0)
+    except Exception:
+        pass
+    return 0
+
+
+def _fetch_running():
+    # Pure-Python /proc scan: what pgrep does, minus the fork+exec
+    try:
+        for name in os.listdir('/proc'):
+            if not name.isdigit():
+                continue
+            try:
+                with open(f'/proc/{name}/cmdline', 'rb') as f:
+                    if b'smart_observer.py' in f.read():
+                        return True
+            except OSError:
+                continue
+    except OSError:
+        pass
+    return False
+
+
+def _battery_percentage():
+    if time.monotonic() - _battery_cache['t'] < 15.0:
+        return _battery_cache['v']
+    _battery_cache['v'] = _fetch_battery()
+    _battery_cache['t'] = time.monotonic()
+    return _battery_cache['v']
+
+
+def _observer_running():
+    if time.monotonic() - _running_cache['t'] < 15.0:
+        return _running_cache['v']
+    _running_cache['v'] = _fetch_running()
+    _running_cache['t'] = time.monotonic()
+    return _running_cache['v']
+
+
+def _probe_loop():
+    """Refresh the probe caches every 10s from one daemon thread
+
+    This decouples the fork rate from the request rate: no matter how many
+    tabs or SSE streams are connected, termux-battery-status runs six times
+    a minute, and handlers only ever read the caches.
+    """
+    while True:
+        _battery_cache['v'] = _fetch_battery()
+        _battery_cache['t'] = time.monotonic()
+        _running_cache['v'] = _fetch_running()
+        _running_cache['t'] = time.monotonic()
+        time.sleep(10.0)
+
+
+# Precompiled bytes patterns: match on raw bytes, decode only the hits
+_DETECT_RE = re.compile(rb'\[([\d-]+) ([\d:]+)\] DETECTED: (.+)')
+_ITEM_RE = re.compile(rb'(\d+) (\w+)')
+
+# Incremental log cache shared by the events/stats endpoints: each refresh
+# parses only the bytes appended since the previous one.
+_log_lock = threading.Lock()
+_log_cache = {'size': 0, 'date': None, 'events': [], 'stats': defaultdict(int)}
+
+# Detected class names come from a tiny fixed vocabulary; interning the
+# decoded strings means a bulk reparse allocates each name exactly once
+_class_names = {}
+
+
+def _parse_detections(path, start, size, today_b):
+    """Fold today's DETECTED lines in path[start:size) into the cache
+
+    Maps the file and lets the regex engine walk the raw bytes in C: no
+    per-line objects, no copy of the unparsed region. Returns the offset
+    just past the last complete line. Caller holds _log_lock.
+    """
+    with open(path, 'rb') as f:
+        mm = mmap.mmap(f.fileno(), size, access=mmap.ACCESS_READ)
+    try:
+        end = mm.rfind(b'\n', start)
+        if end < 0:
+            return start
+        events = _log_cache['events']
+        stats = _log_cache['stats']
+        for match in _DETECT_RE.finditer(mm, start, end):
+            if match.group(1) != today_b:
+                continue
+            detection = match.group(3)
+            events.append({
+                'time': match.group(2).decode(),
+                'detection': detection.decode(errors='replace')
+            })
+            for count, obj_type in _ITEM_RE.findall(detection):
+                name = _class_names.get(obj_type)
+                if name is None:
+                    name = _class_names[obj_type] = obj_type.decode()
+                stats[name] += int(count)
+        return end + 1
+    finally:
+        mm.close()
+
+
+def _refresh_log_cache():
+    """Bring the cache up to date; returns (events, stats) snapshots"""
+    with _log_lock:
+        today = datetime.now().strftime('%Y-%m-%d')
+        today_b = today.encode()
+        try:
+            st = os.stat(LOG_FILE)
+        except OSError:
+            st = None
+
+        if st is None or st.st_size < _log_cache['size'] or today != _log_cache['date']:
+            # Missing/shrunken log or day rollover: start over. A shrink
+            # is watch.py's normal rotation signal — today's earlier lines
+            # now live in street_log.1.txt, so fold those in first or the
+            # dashboard's counts reset mid-day while watch.py keeps them
+            _log_cache['size'] = 0
+            _log_cache['date'] = today
+            _log_cache['events'] = []
+            _log_cache['stats'] = defaultdict(int)
+            try:
+                rst = os.stat(ROTATED_LOG)
+                # Skip rotated files last written before today: they can't
+                # contain today's lines, and the filter below is not free
+                if datetime.fromtimestamp(rst.st_mtime).strftime('%Y-%m-%d') == today:
+                    _parse_detections(ROTATED_LOG, 0, rst.st_size, today_b)
+            except OSError:
+                pass
+
+        if st is not None and st.st_size > _log_cache['size']:
+            _log_cache['size'] = _parse_detections(
+                LOG_FILE, _log_cache['size'], st.st_size, today_b)
+
+        return list(_log_cache['events']), dict(_log_cache['stats'])
 
 HTML_TEMPLATE = """<!DOCTYPE html>
 <html lang="en">
@@ -314,6 +496,40 @@ HTML_TEMPLATE = """<!DOCTYPE html>
         const API_TOKEN = localStorage.getItem('auth_token') || prompt('Enter access token:');
         localStorage.setItem('auth_token', API_TOKEN);
 
+        // Look every dashboard element up once; refreshData runs forever on a
+        // 30s timer and shouldn't re-query the DOM each pass
+        const els = {
+            observerStatus: document.getElementById('observer-status'),
+            batteryLevel: document.getElementById('battery-level'),
+            eventsToday: document.getElementById('events-today'),
+            statCar: document.getElementById('stat-car'),
+            statPerson: document.getElementById('stat-person'),
+            statBicycle: document.getElementById('stat-bicycle'),
+            statMotorcycle: document.getElementById('stat-motorcycle'),
+            eventsList: document.getElementById('events-list'),
+            imageGrid: document.getElementById('image-grid'),
+            backCamera: document.getElementById('back-camera'),
+            backTimestamp: document.getElementById('back-timestamp'),
+            frontCamera: document.getElementById('front-camera'),
+            frontTimestamp: document.getElementById('front-timestamp'),
+            modal: document.getElementById('modal'),
+            modalImg: document.getElementById('modal-img')
+        };
+
+        function makeSpan(text, cls) {
+            const s = document.createElement('span');
+            if (cls) s.className = cls;
+            s.textContent = text;
+            return s;
+        }
+
+        function makeMessage(text) {
+            const p = document.createElement('p');
+            p.style.cssText = 'color: #888; text-align: center;';
+            p.textContent = text;
+            return p;
+        }
+
         async function api(endpoint, method = 'GET') {
             try {
                 const res = await fetch('/api/' + endpoint, {
@@ -327,56 +543,61 @@ HTML_TEMPLATE = """<!DOCTYPE html>
             }
         }
 
-        async function refreshData() {
-            document.body.classList.add('loading');
-
-            const status = await api('status');
-            if (!status.error) {
-                document.getElementById('observer-status').textContent =
-                    status.running ? '🟢 ON' : '🔴 OFF';
-                document.getElementById('observer-status').className =
+        function renderState(state) {
+            if (!state.error) {
+                const status = state.status;
+                els.observerStatus.textContent = status.running ? '🟢 ON' : '🔴 OFF';
+                els.observerStatus.className =
                     'status-value ' + (status.running ? 'running' : 'stopped');
-                document.getElementById('battery-level').textContent =
-                    status.battery + '%';
-                document.getElementById('events-today').textContent =
-                    status.events_today;
-            }
-
-            const stats = await api('stats');
-            if (!stats.error) {
-                document.getElementById('stat-car').textContent = stats.car || 0;
-                document.getElementById('stat-person').textContent = stats.person || 0;
-                document.getElementById('stat-bicycle').textContent = stats.bicycle || 0;
-                document.getElementById('stat-motorcycle').textContent = stats.motorcycle || 0;
-            }
-
-            const events = await api('events');
-            if (!events.error && events.events) {
-                const list = document.getElementById('events-list');
-                if (events.events.length === 0) {
-                    list.innerHTML = '<p style="color: #888; text-align: center;">No events yet</p>';
+                els.batteryLevel.textContent = status.battery + '%';
+                els.eventsToday.textContent = status.events_today;
+
+                const stats = state.stats || {};
+                els.statCar.textContent = stats.car || 0;
+                els.statPerson.textContent = stats.person || 0;
+                els.statBicycle.textContent = stats.bicycle || 0;
+                els.statMotorcycle.textContent = stats.motorcycle || 0;
+
+                const events = state.events || [];
+                if (events.length === 0) {
+                    els.eventsList.replaceChildren(makeMessage('No events yet'));
                 } else {
-                    list.innerHTML = events.events.slice(-15).reverse().map(e =>
-                        '<div class="event-item"><span>' + e.detection + '</span><span class="event-time">' + e.time + '</span></div>'
-                    ).join('');
+                    // Fragment + textContent: one reflow, no HTML parsing of
+                    // log-derived strings
+                    const frag = document.createDocumentFragment();
+                    for (const e of events.slice(-15).reverse()) {
+                        const item = document.createElement('div');
+                        item.className = 'event-item';
+                        item.append(makeSpan(e.detection), makeSpan(e.time, 'event-time'));
+                        frag.appendChild(item);
+                    }
+                    els.eventsList.replaceChildren(frag);
                 }
-            }
 
-            const images = await api('images');
-            if (!images.error && images.images) {
-                const grid = document.getElementById('image-grid');
-                if (images.images.length === 0) {
-                    grid.innerHTML = '<p style="color: #888; text-align: center;">No images yet</p>';
+                const images = state.images || [];
+                if (images.length === 0) {
+                    els.imageGrid.replaceChildren(makeMessage('No images yet'));
                 } else {
-                    grid.innerHTML = images.images.slice(-8).reverse().map(function(img) {
-                        return '<img class="image-thumb" src="/image/' + img.filename + '" onclick="openModal(this.src)" title="' + img.filename + '">';
-                    }).join('');
+                    const frag = document.createDocumentFragment();
+                    for (const img of images.slice(-8).reverse()) {
+                        const thumb = document.createElement('img');
+                        thumb.className = 'image-thumb';
+                        thumb.src = '/image/' + img.filename;
+                        thumb.title = img.filename;
+                        thumb.onclick = function() { openModal(this.src); };
+                        frag.appendChild(thumb);
+                    }
+                    els.imageGrid.replaceChildren(frag);
                 }
-            }
 
-            // Load live view snapshots
-            await loadLiveView();
+                renderLiveView(state.live || {});
+            }
+        }
 
+        async function refreshData() {
+            document.body.classList.add('loading');
+            // One round trip for status, stats, events, images and live view
+            renderState(await api('state'));
             document.body.classList.remove('loading');
         }
 
@@ -390,28 +611,23 @@ HTML_TEMPLATE = """<!DOCTYPE html>
             };
         }
 
-        async function loadLiveView() {
-            const liveData = await api('live');
+        function renderLiveView(liveData) {
             if (!liveData.error) {
                 if (liveData.back) {
-                    var backSrc = '/image/' + liveData.back.filename + '?t=' + Date.now();
                     var backImg = document.createElement('img');
-                    backImg.src = backSrc;
+                    backImg.src = '/image/' + liveData.back.filename + '?t=' + Date.now();
                     backImg.onclick = function() { openModal(this.src); };
                     setImageOrientation(backImg);
-                    document.getElementById('back-camera').innerHTML = '';
-                    document.getElementById('back-camera').appendChild(backImg);
-                    document.getElementById('back-timestamp').textContent = liveData.back.time || '';
+                    els.backCamera.replaceChildren(backImg);
+                    els.backTimestamp.textContent = liveData.back.time || '';
                 }
                 if (liveData.front) {
-                    var frontSrc = '/image/' + liveData.front.filename + '?t=' + Date.now();
                     var frontImg = document.createElement('img');
-                    frontImg.src = frontSrc;
+                    frontImg.src = '/image/' + liveData.front.filename + '?t=' + Date.now();
                     frontImg.onclick = function() { openModal(this.src); };
                     setImageOrientation(frontImg);
-                    document.getElementById('front-camera').innerHTML = '';
-                    document.getElementById('front-camera').appendChild(frontImg);
-                    document.getElementById('front-timestamp').textContent = liveData.front.time || '';
+                    els.frontCamera.replaceChildren(frontImg);
+                    els.frontTimestamp.textContent = liveData.front.time || '';
                 }
             }
         }
@@ -432,93 +648,181 @@ HTML_TEMPLATE = """<!DOCTYPE html>
         }
 
         function openModal(src) {
-            document.getElementById('modal-img').src = src;
-            document.getElementById('modal').classList.add('active');
+            els.modalImg.src = src;
+            els.modal.classList.add('active');
         }
 
         function closeModal() {
-            document.getElementById('modal').classList.remove('active');
+            els.modal.classList.remove('active');
         }
 
-        // Initial load and auto-refresh
+        // Initial load, then server-pushed updates; EventSource reconnects
+        // by itself if the stream drops
         refreshData();
-        setInterval(refreshData, 30000);
+        const stream = new EventSource('/api/stream?token=' + encodeURIComponent(API_TOKEN));
+        stream.onmessage = function(msg) {
+            renderState(JSON.parse(msg.data));
+        };
     </script>
 </body>
 </html>
 """
 
+def _extract_assets(template):
+    """Turn the authored page into its shipped form, once at import
+
+    The template above stays readable; here the inline CSS is minified in
+    place and the script is split out to /static/app.js so browsers can
+    cache it across page loads, referenced by a content-hash URL.
+    """
+    css = re.search(r'<style>([\s\S]*?)</style>', template)
+    minified = re.sub(r'\s+', ' ', css.group(1))
+    minified = re.sub(r'\s*([{}:;,])\s*', r'\1', minified)
+    template = (template[:css.start()] + '<style>' + minified + '</style>'
+                + template[css.end():])
+
+    script = re.search(r'<script>([\s\S]*?)</script>', template)
+    js = script.group(1).encode()
+    tag = f'<script src="/static/app.js?v={hashlib.md5(js).hexdigest()[:8]}"></script>'
+    template = template[:script.start()] + tag + template[script.end():]
+    return template, js
+
+
+# Static per process: minify, split, compress and fingerprint once at import
+HTML_TEMPLATE, _APP_JS = _extract_assets(HTML_TEMPLATE)
+_APP_JS_GZ = gzip.compress(_APP_JS, 9)
+_APP_JS_ETAG = '"' + hashlib.md5(_APP_JS).hexdigest() + '"'
+
+_HTML_BYTES = HTML_TEMPLATE.encode()
+_HTML_GZ = gzip.compress(_HTML_BYTES, 9)
+_HTML_ETAG = '"' + hashlib.md5(_HTML_BYTES).hexdigest() + '"'
+
 
 class WatchHandler(BaseHTTPRequestHandler):
+    # Keep-alive: one connection carries the whole refresh burst (API call
+    # plus up to 8 thumbnails) instead of a TCP handshake per request.
+    # Every response must carry Content-Length for this to work.
+    protocol_version = 'HTTP/1.1'
+
     def log_message(self, format, *args):
-        print(f"[{datetime.now().strftime('%H:%M:%S')}] {args[0]}")
+        # Log the path only: the request line carries the query string,
+        # and /api/stream puts the auth token there (EventSource can't
+        # set headers) — it must not end up in the server log
+        line = str(args[0])
+        try:
+            method, target, version = line.split(' ', 2)
+            line = f"{method} {target.split('?', 1)[0]} {version}"
+        except ValueError:
+            pass
+        print(f"[{datetime.now().strftime('%H:%M:%S')}] {line}")
 
     def check_auth(self):
-        token = self.headers.get('Authorization', '')
-        return token == AUTH_TOKEN
+        # Constant-time compare: a naive == leaks match length via timing
+        token = self.headers.get('Authorization', '').encode()
+        return hmac.compare_digest(token, _AUTH_TOKEN_BYTES)
 
     def send_json(self, data, status=200):
+        payload = _json_dumps(data)
         self.send_response(status)
         self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
         self.send_header('Access-Control-Allow-Origin', '*')
         self.end_headers()
-        self.wfile.write(json.dumps(data).encode())
+        self.wfile.write(payload)
 
-    def send_html(self, html):
+    def send_static(self, body, body_gz, etag, content_type, cache_control=None):
+        if self.headers.get('If-None-Match') == etag:
+            self.send_not_modified(etag)
+            return
+        gzipped = 'gzip' in self.headers.get('Accept-Encoding', '')
+        payload = body_gz if gzipped else body
         self.send_response(200)
-        self.send_header('Content-Type', 'text/html')
+        self.send_header('Content-Type', content_type)
+        self.send_header('ETag', etag)
+        if cache_control:
+            self.send_header('Cache-Control', cache_control)
+        if gzipped:
+            self.send_header('Content-Encoding', 'gzip')
+        self.send_header('Content-Length', str(len(payload)))
         self.end_headers()
-        self.wfile.write(html.encode())
+        self.wfile.write(payload)
 
-    def get_battery(self):
+    def send_not_modified(self, etag):
+        self.send_response(304)
+        self.send_header('ETag', etag)
+        self.end_headers()
+
+    def _state_payload(self):
+        """Everything the dashboard renders, as one dict"""
+        events = self.get_events_today()
+        return {
+            'status': {
+                'running': self.is_observer_running(),
+                'battery': self.get_battery(),
+                'events_today': len(events)
+            },
+            'stats': self.get_stats_today(),
+            'events': events,
+            'images': self.get_images(),
+            'live': self.get_live_images()
+        }
+
+    def _state_signature(self):
+        """Cheap change detector for the SSE stream: one stat plus cache reads"""
         try:
-            result = subprocess.run(['termux-battery-status'],
-                                  capture_output=True, text=True, timeout=5)
-            if result.returncode == 0:
-                data = json.loads(result.stdout)
-                return data.get('percentage', 0)
-        except:
-            pass
-        return 0
+            st = os.stat(LOG_FILE)
+            log_sig = (st.st_mtime_ns, st.st_size)
+        except OSError:
+            log_sig = None
+        back, front = _latest_live['back'], _latest_live['front']
+        return (log_sig,
+                back and back['filename'],
+                front and front['filename'],
+                _running_cache['v'], _battery_cache['v'])
+
+    def stream_state(self):
+        """Server-sent events: push state only when something changed
+
+        Each subscriber parks one daemon thread in a 1s stat loop, which is
+        fine for the couple of tabs this dashboard sees and replaces their
+        30s full-refresh polling with zero idle work server-side.
+        """
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/event-stream')
+        self.send_header('Cache-Control', 'no-cache')
+        self.send_header('Access-Control-Allow-Origin', '*')
+        self.end_headers()
+        last_sig = None
+        last_write = time.monotonic()
+        try:
+            while True:
+                sig = self._state_signature()
+                now = time.monotonic()
+                if sig != last_sig:
+                    self.wfile.write(b'data: ' + _json_dumps(self._state_payload()) + b'\n\n')
+                    self.wfile.flush()
+                    last_sig = sig
+                    last_write = now
+                elif now - last_write > 25.0:
+                    # Comment frame so proxies/browsers don't drop the socket
+                    self.wfile.write(b': keep-alive\n\n')
+                    self.wfile.flush()
+                    last_write = now
+                time.sleep(1.0)
+        except OSError:
+            pass  # Client closed the tab
+
+    def get_battery(self):
+        return _battery_percentage()
 
     def is_observer_running(self):
-        try:
-            result = subprocess.run(['pgrep', '-f', 'smart_observer.py'],
-                                  capture_output=True)
-            return result.returncode == 0
-        except:
-            return False
+        return _observer_running()
 
     def get_events_today(self):
-        today = datetime.now().strftime('%Y-%m-%d')
-        events = []
-        if LOG_FILE.exists():
-            with open(LOG_FILE) as f:
-                for line in f:
-                    if today in line and 'DETECTED' in line:
-                        match = re.search(r'\[[\d-]+ ([\d:]+)\] DETECTED: (.+)', line)
-                        if match:
-                            events.append({
-                                'time': match.group(1),
-                                'detection': match.group(2)
-                            })
-        return events
+        return _refresh_log_cache()[0]
 
     def get_stats_today(self):
-        today = datetime.now().strftime('%Y-%m-%d')
-        stats = defaultdict(int)
-        if LOG_FILE.exists():
-            with open(LOG_FILE) as f:
-                for line in f:
-                    if today in line and 'DETECTED' in line:
-                        match = re.search(r'DETECTED: (.+)', line)
-                        if match:
-                            for item in match.group(1).split(', '):
-                                parts = item.strip().split(' ')
-                                if len(parts) == 2:
-                                    count, obj_type = int(parts[0]), parts[1]
-                                    stats[obj_type] += count
-        return dict(stats)
+        return _refresh_log_cache()[1]
 
     def get_images(self):
         images = []
@@ -536,27 +840,40 @@ class WatchHandler(BaseHTTPRequestHandler):
 
     def get_live_images(self):
         """Get the latest live snapshots for each camera"""
-        result = {'back': None, 'front': None}
-
-        # Find latest back camera image
-        back_files = sorted(DATA_DIR.glob('live_back_*.jpg'))
-        if back_files:
-            f = back_files[-1]
-            result['back'] = {
-                'filename': f.name,
-                'time': datetime.fromtimestamp(f.stat().st_mtime).strftime('%H:%M:%S')
-            }
+        if _latest_live['back'] is None or _latest_live['front'] is None:
+            self._scan_live_images()
+        return dict(_latest_live)
 
-        # Find latest front camera image
-        front_files = sorted(DATA_DIR.glob('live_front_*.jpg'))
-        if front_files:
-            f = front_files[-1]
-            result['front'] = {
-                'filename': f.name,
-                'time': datetime.fromtimestamp(f.stat().st_mtime).strftime('%H:%M:%S')
-            }
+    def _scan_live_images(self):
+        """Fill the in-process pointers from disk (startup / missing camera)
+
+        Timestamped names sort chronologically, so one scandir pass with a
+        running max per camera replaces two sorted globs.
+        """
+        best = {'back': None, 'front': None}
+        try:
+            with os.scandir(DATA_DIR) as it:
+                for entry in it:
+                    name = entry.name
+                    if not name.endswith('.jpg'):
+                        continue
+                    if name.startswith('live_back_'):
+                        camera = 'back'
+                    elif name.startswith('live_front_'):
+                        camera = 'front'
+                    else:
+                        continue
+                    if best[camera] is None or name > best[camera].name:
+                        best[camera] = entry
+        except FileNotFoundError:
+            pass
 
-        return result
+        for camera, entry in best.items():
+            if entry is not None:
+                _latest_live[camera] = {
+                    'filename': entry.name,
+                    'time': datetime.fromtimestamp(entry.stat().st_mtime).strftime('%H:%M:%S')
+                }
 
     def take_snapshot(self, camera='back'):
         """Take a snapshot with specified camera"""
@@ -566,15 +883,34 @@ class WatchHandler(BaseHTTPRequestHandler):
         filepath = DATA_DIR / filename
 
         try:
-            result = subprocess.run(
-                ['termux-camera-photo', '-c', camera_id, str(filepath)],
-                capture_output=True, timeout=15
-            )
+            with _snapshot_sem:
+                # Only the exit code and output file matter; skip the pipes
+                result = subprocess.run(
+                    ['termux-camera-photo', '-c', camera_id, str(filepath)],
+                    stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                    timeout=15
+                )
             if result.returncode == 0 and filepath.exists():
-                # Clean up old live images (keep last 5 per camera)
-                old_files = sorted(DATA_DIR.glob(f'live_{camera}_*.jpg'))[:-5]
-                for f in old_files:
-                    f.unlink()
+                _latest_live[camera] = {
+                    'filename': filename,
+                    'time': datetime.now().strftime('%H:%M:%S')
+                }
+                # Clean up old live images (keep last 5 per camera).
+                # nlargest finds the keepers in one O(N) pass; no need to
+                # sort the whole history just to drop its tail
+                prefix = f'live_{camera}_'
+                with os.scandir(DATA_DIR) as it:
+                    entries = [e for e in it
+                               if e.name.startswith(prefix) and e.name.endswith('.jpg')]
+                if len(entries) > 5:
+                    keepers = {e.name for e in
+                               heapq.nlargest(5, entries, key=lambda e: e.name)}
+                    for e in entries:
+                        if e.name not in keepers:
+                            try:
+                                os.unlink(e.path)
+                            except OSError:
+                                pass
                 return {'success': True, 'filename': filename}
             else:
                 return {'success': False, 'error': 'Capture failed'}
@@ -586,18 +922,40 @@ class WatchHandler(BaseHTTPRequestHandler):
 
         # Main page - no auth required for page, auth for API
         if path == '/' or path == '/index.html':
-            self.send_html(HTML_TEMPLATE)
+            self.send_static(_HTML_BYTES, _HTML_GZ, _HTML_ETAG, 'text/html')
+            return
+
+        # Content-hashed URL, so repeat loads never re-download the script
+        if path == '/static/app.js':
+            self.send_static(_APP_JS, _APP_JS_GZ, _APP_JS_ETAG,
+                             'application/javascript',
+                             'public, max-age=86400, immutable')
             return
 
         # API endpoints - auth required
         if path.startswith('/api/'):
+            endpoint = path[5:]  # Remove '/api/'
+
+            if endpoint == 'stream':
+                # EventSource can't set headers, so the token rides in the
+                # query string for this endpoint only
+                query = urllib.parse.parse_qs(urllib.parse.urlparse(self.path).query)
+                token = (query.get('token') or [''])[0].encode()
+                if not hmac.compare_digest(token, _AUTH_TOKEN_BYTES):
+                    self.send_json({'error': 'Unauthorized'}, 401)
+                else:
+                    self.stream_state()
+                return
+
             if not self.check_auth():
                 self.send_json({'error': 'Unauthorized'}, 401)
                 return
 
-            endpoint = path[5:]  # Remove '/api/'
-
-            if endpoint == 'status':
+            if endpoint == 'state':
+                # Everything the dashboard needs in one round trip; events
+                # and stats share a single cached log parse
+                self.send_json(self._state_payload())
+            elif endpoint == 'status':
                 self.send_json({
                     'running': self.is_observer_running(),
                     'battery': self.get_battery(),
@@ -619,14 +977,50 @@ class WatchHandler(BaseHTTPRequestHandler):
         if path.startswith('/image/'):
             filename = path[7:].split('?')[0]  # Remove query params
             filepath = DATA_DIR / filename
-            if filepath.exists() and filepath.suffix == '.jpg':
-                self.send_response(200)
-                self.send_header('Content-Type', 'image/jpeg')
-                self.send_header('Cache-Control', 'no-cache')
-                self.end_headers()
-                with open(filepath, 'rb') as f:
-                    self.wfile.write(f.read())
-                return
+            if filepath.suffix == '.jpg':
+                # Open once and fstat the handle: one syscall instead of the
+                # exists/stat/open triple, and no exists-vs-open race
+                try:
+                    f = open(filepath, 'rb')
+                except OSError:
+                    f = None
+                if f is not None:
+                    with f:
+                        st = os.fstat(f.fileno())
+                        size = st.st_size
+                        # Captures are immutable per name; mtime+size identify them
+                        etag = f'"{st.st_mtime_ns:x}-{size:x}"'
+                        if self.headers.get('If-None-Match') == etag:
+                            self.send_not_modified(etag)
+                            return
+                        self.send_response(200)
+                        self.send_header('Content-Type', 'image/jpeg')
+                        self.send_header('Content-Length', str(size))
+                        self.send_header('ETag', etag)
+                        # Live snapshots may briefly revalidate from browser cache;
+                        # everything else is fetched once per unique name anyway
+                        if filename.startswith('live_'):
+                            self.send_header('Cache-Control', 'max-age=5')
+                        else:
+                            self.send_header('Cache-Control', 'no-cache')
+                        self.end_headers()
+                        self.wfile.flush()
+                        offset = 0
+                        try:
+                            # In-kernel copy: no file-sized buffer through Python
+                            out_fd = self.wfile.fileno()
+                            while offset < size:
+                                sent = os.sendfile(out_fd, f.fileno(), offset,
+                                                   size - offset)
+                                if sent == 0:
+                                    break
+                                offset += sent
+                        except OSError:
+                            if offset:
+                                raise  # Client went away mid-transfer
+                            # sendfile unsupported here; fall back to buffered copy
+                            shutil.copyfileobj(f, self.wfile, 64 * 1024)
+                    return
 
         self.send_json({'error': 'Not found'}, 404)
 
@@ -645,18 +1039,27 @@ class WatchHandler(BaseHTTPRequestHandler):
 
         if endpoint == 'start':
             if not self.is_observer_running():
-                subprocess.Popen(
-                    ['python3', str(BASE_DIR / 'smart_observer.py')],
-                    stdout=open(BASE_DIR / '.observer.log', 'w'),
-                    stderr=subprocess.STDOUT,
-                    start_new_session=True
-                )
+                # Hand the child a raw append fd; the parent keeps nothing open
+                log_fd = os.open(BASE_DIR / '.observer.log',
+                                 os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+                try:
+                    subprocess.Popen(
+                        ['python3', str(BASE_DIR / 'smart_observer.py')],
+                        stdin=subprocess.DEVNULL,
+                        stdout=log_fd,
+                        stderr=subprocess.STDOUT,
+                        start_new_session=True
+                    )
+                finally:
+                    os.close(log_fd)
+                _running_cache['t'] = 0.0  # Re-probe on next status poll
                 self.send_json({'message': 'Observer started'})
             else:
                 self.send_json({'message': 'Already running'})
 
         elif endpoint == 'stop':
             subprocess.run(['pkill', '-f', 'smart_observer.py'])
+            _running_cache['t'] = 0.0  # Re-probe on next status poll
             self.send_json({'message': 'Observer stopped'})
 
         elif endpoint == 'snapshot/back':
@@ -689,6 +1092,7 @@ class WatchHandler(BaseHTTPRequestHandler):
         self.send_header('Access-Control-Allow-Origin', '*')
         self.send_header('Access-Control-Allow-Methods', 'GET, POST, OPTIONS')
         self.send_header('Access-Control-Allow-Headers', 'Authorization')
+        self.send_header('Content-Length', '0')
         self.end_headers()
 
 
@@ -712,7 +1116,12 @@ def main():
   Press Ctrl+C to stop
 """)
 
-    server = HTTPServer(('0.0.0.0', port), WatchHandler)
+    # Keep the probe caches warm so handlers never fork on the hot path
+    threading.Thread(target=_probe_loop, daemon=True, name='probe-poller').start()
+
+    # Threaded so a slow handler (e.g. a 15s camera capture) doesn't stall
+    # status polls and image fetches from other clients
+    server = ThreadedHTTPServer(('0.0.0.0', port), WatchHandler)
 
     try:
         server.serve_forever()